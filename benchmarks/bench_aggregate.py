@@ -0,0 +1,41 @@
+import pytest
+import xarray as xr
+
+import synthetic
+from synthetic import N_LGAS, N_STATES
+from lassa_model.aggregate import daily_to_states, hourly_to_daily, state_daily_to_weekly
+
+
+@pytest.mark.parametrize("days", [7, 31])
+def test_hourly_to_daily(benchmark, tmp_path, days):
+    instant_path, accum_path = synthetic.write_era5_month(tmp_path, days)
+
+    def run():
+        with xr.open_dataset(instant_path) as instant, xr.open_dataset(accum_path) as accum:
+            return hourly_to_daily(instant, accum).load()
+
+    out = benchmark(run)
+
+    assert out.sizes["time"] == days
+
+
+@pytest.mark.parametrize("n_regions", [N_STATES, N_LGAS])
+def test_daily_to_states(benchmark, n_regions):
+    pytest.importorskip("rioxarray")
+    pytest.importorskip("geopandas")
+
+    ds = synthetic.era5_daily(31)
+    regions = synthetic.region_polygons(n_regions)
+
+    out = benchmark.pedantic(daily_to_states, args=(ds, regions), rounds=3, iterations=1)
+
+    assert out["state"].nunique() == n_regions
+
+
+@pytest.mark.parametrize("n_regions", [N_STATES, N_LGAS])
+def test_state_daily_to_weekly(benchmark, n_regions):
+    df = synthetic.state_daily(n_regions)
+
+    out = benchmark(state_daily_to_weekly, df)
+
+    assert out["state"].nunique() == n_regions
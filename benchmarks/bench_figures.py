@@ -0,0 +1,32 @@
+import pytest
+
+import synthetic
+from synthetic import N_LGAS, N_STATES
+from lassa_model.plots import render_state, report_tasks, state_reports
+
+
+@pytest.mark.parametrize("n_regions", [N_STATES, N_LGAS])
+def test_report_tasks(benchmark, tmp_path, n_regions):
+    df = synthetic.weekly_panel(n_regions)
+
+    tasks, skipped = benchmark(report_tasks, df, str(tmp_path))
+
+    assert len(tasks) == n_regions
+
+
+def test_render_state(benchmark, tmp_path):
+    tasks, _ = report_tasks(synthetic.weekly_panel(1), str(tmp_path))
+    render_state(tasks[0])  # build the reused figure outside the timing
+
+    benchmark(render_state, tasks[0])
+
+
+def test_state_reports_unchanged(benchmark, tmp_path):
+    panel = tmp_path / "panel.csv"
+    synthetic.weekly_panel(N_STATES).to_csv(panel, index=False)
+    out_dir = str(tmp_path / "figs")
+    state_reports(panel=str(panel), out_dir=out_dir, workers=1)
+
+    paths = benchmark(state_reports, panel=str(panel), out_dir=out_dir, workers=1)
+
+    assert paths == []
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from lassa_model.forcing import ForcingParams, make_beta_function
+from lassa_model.model import SEIRParams, seir_weekly
+from lassa_model.simulate import simulate_seir
+
+
+@pytest.mark.parametrize("weeks", [209, 2_090, 20_900])
+def test_seir_weekly(benchmark, weeks):
+    rng = np.random.default_rng(0)
+    forcing = np.exp(rng.normal(0.0, 0.2, weeks))
+
+    S, E, I, R = benchmark(seir_weekly, weeks, forcing)
+
+    assert len(I) == weeks
+
+
+@pytest.mark.parametrize("years", [1, 4])
+def test_simulate_seir(benchmark, years):
+    t_days = np.arange(0, 365 * years + 1, 1)
+    N = 1_000_000.0
+    y0 = (N - 30.0, 20.0, 10.0, 0.0)
+    epi = SEIRParams(sigma=1.0 / 10.0, gamma=1.0 / 14.0)
+    beta_t = make_beta_function(ForcingParams(beta0=0.35, season_amp=0.20, season_phase=30.0, climate_coeff=0.25))
+
+    res = benchmark(simulate_seir, t_days=t_days, y0=y0, N=N, params=epi, beta_t=beta_t)
+
+    assert len(res["I"]) == len(t_days)
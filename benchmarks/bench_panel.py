@@ -0,0 +1,34 @@
+import pytest
+
+import synthetic
+from synthetic import N_LGAS, N_STATES
+from lassa_model.alerts import add_alerts
+from lassa_model.panel import balanced_panel, weekly_state_counts
+
+
+@pytest.mark.parametrize("n_rows", [1_000, 10_000, 100_000])
+def test_weekly_state_counts(benchmark, n_rows):
+    df, labels = synthetic.line_list(n_rows)
+
+    out = benchmark(weekly_state_counts, df, labels)
+
+    assert out["cases"].sum() <= n_rows
+
+
+@pytest.mark.parametrize("n_regions", [N_STATES, N_LGAS])
+def test_balanced_panel(benchmark, n_regions):
+    df = synthetic.weekly_cases(n_regions)
+    states = synthetic.state_names(n_regions)
+
+    out = benchmark(balanced_panel, df, states)
+
+    assert out["cases"].sum() == df["cases"].sum()
+
+
+@pytest.mark.parametrize("n_regions", [N_STATES, N_LGAS])
+def test_add_alerts(benchmark, n_regions):
+    df = synthetic.weekly_panel(n_regions)
+
+    out = benchmark(add_alerts, df, 8)
+
+    assert len(out) == len(df)
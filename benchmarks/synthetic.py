@@ -0,0 +1,203 @@
+"""
+Deterministic synthetic inputs for the benchmark suite.
+
+Every generator takes an explicit seed so that the same scale always
+produces byte-identical data, which keeps benchmark runs comparable
+against stored baselines.
+"""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# Nigeria bounding box (N, W, S, E), same as the ERA5 download scripts
+NGA_BBOX = (14.0, 2.5, 4.0, 15.0)
+ERA5_RES = 0.25
+
+# Region counts: GADM level 1 (36 states + FCT) and level 2 (LGAs)
+N_STATES = 37
+N_LGAS = 774
+
+
+def state_names(n: int) -> List[str]:
+    return [f"Region {i:03d}" for i in range(n)]
+
+
+# -------------------------
+# ERA5-like grids
+# -------------------------
+def era5_hourly(days: int, start: str = "2021-01-01", seed: int = 0) -> Tuple[xr.Dataset, xr.Dataset]:
+    """
+    Hourly (instant, accum) datasets shaped like the two CDS streams:
+    t2m in Kelvin and tp in metres on a 0.25° lat/lon grid with a
+    'valid_time' coordinate.
+    """
+    rng = np.random.default_rng(seed)
+    north, west, south, east = NGA_BBOX
+    lat = np.arange(north, south - 1e-9, -ERA5_RES)
+    lon = np.arange(west, east + 1e-9, ERA5_RES)
+    time = pd.date_range(start, periods=days * 24, freq="h")
+
+    hour = np.arange(len(time))[:, None, None]
+    diurnal = 5.0 * np.sin(2.0 * np.pi * (hour % 24) / 24.0)
+    gradient = 0.3 * (lat[None, :, None] - south)
+    t2m = 300.0 + diurnal - gradient + rng.normal(0.0, 0.5, (len(time), len(lat), len(lon)))
+
+    wet = rng.random((len(time), len(lat), len(lon))) < 0.1
+    tp = np.where(wet, rng.exponential(5e-4, wet.shape), 0.0)
+
+    coords = {"valid_time": time, "latitude": lat, "longitude": lon}
+    dims = ("valid_time", "latitude", "longitude")
+    instant = xr.Dataset({"t2m": (dims, t2m.astype("float32"))}, coords=coords)
+    accum = xr.Dataset({"tp": (dims, tp.astype("float32"))}, coords=coords)
+    return instant, accum
+
+
+def write_era5_month(out_dir: Path, days: int, seed: int = 0) -> Tuple[Path, Path]:
+    """
+    Write the instant/accum streams as NetCDF files named like an
+    unzipped CDS month.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    instant, accum = era5_hourly(days, seed=seed)
+    instant_path = out_dir / "data_stream-oper_stepType-instant.nc"
+    accum_path = out_dir / "data_stream-oper_stepType-accum.nc"
+    instant.to_netcdf(instant_path)
+    accum.to_netcdf(accum_path)
+    return instant_path, accum_path
+
+
+def era5_daily(days: int, seed: int = 0) -> xr.Dataset:
+    """
+    Daily rain_mm/temp_c grid, i.e. the output of the hourly -> daily step.
+    """
+    from lassa_model.aggregate import hourly_to_daily
+
+    instant, accum = era5_hourly(days, seed=seed)
+    return hourly_to_daily(instant, accum)
+
+
+# -------------------------
+# GADM-like polygons
+# -------------------------
+def region_polygons(n: int, seed: int = 0):
+    """
+    GeoDataFrame of n non-overlapping polygons on a grid over the Nigeria
+    bbox (filled row by row, so the top row may be partial), with a NAME_1
+    column like the GADM level-1 shapefile. Each interior edge's midpoint is
+    jittered once and shared by the two cells on either side, so neighbours
+    meet without gaps and the shapes are not plain rectangles.
+    """
+    import geopandas as gpd
+    from shapely.geometry import Polygon
+
+    rng = np.random.default_rng(seed)
+    north, west, south, east = NGA_BBOX
+    ncols = math.ceil(math.sqrt(n))
+    nrows = math.ceil(n / ncols)
+    dx = (east - west) / ncols
+    dy = (north - south) / nrows
+
+    # Midpoint offsets: jy[r, c] for the horizontal edge below row r,
+    # jx[r, c] for the vertical edge left of column c; the bbox edges stay straight
+    jy = rng.uniform(-0.1, 0.1, (nrows + 1, ncols)) * dy
+    jx = rng.uniform(-0.1, 0.1, (nrows, ncols + 1)) * dx
+    jy[[0, -1], :] = 0.0
+    jx[:, [0, -1]] = 0.0
+
+    geoms = []
+    for k in range(n):
+        r, c = divmod(k, ncols)
+        x0, y0 = west + c * dx, south + r * dy
+        x1, y1 = x0 + dx, y0 + dy
+        geoms.append(Polygon([
+            (x0, y0), ((x0 + x1) / 2, y0 + jy[r, c]),
+            (x1, y0), (x1 + jx[r, c + 1], (y0 + y1) / 2),
+            (x1, y1), ((x0 + x1) / 2, y1 + jy[r + 1, c]),
+            (x0, y1), (x0 + jx[r, c], (y0 + y1) / 2),
+        ]))
+
+    return gpd.GeoDataFrame({"NAME_1": state_names(n)}, geometry=geoms, crs="EPSG:4326")
+
+
+# -------------------------
+# Tabular inputs
+# -------------------------
+def state_daily(n_states: int, years: int = 4, start_year: int = 2018, seed: int = 0) -> pd.DataFrame:
+    """
+    Long state × day climate table, as written by era5_daily_to_state_daily.py.
+    """
+    rng = np.random.default_rng(seed)
+    time = pd.date_range(f"{start_year}-01-01", f"{start_year + years - 1}-12-31", freq="D")
+    n = n_states * len(time)
+    doy = np.tile(time.dayofyear.to_numpy(), n_states)
+    season = np.sin(2.0 * np.pi * (doy - 120) / 365.0)
+
+    return pd.DataFrame({
+        "state": np.repeat(state_names(n_states), len(time)),
+        "time": np.tile(time, n_states),
+        "rain_mm": np.clip(4.0 + 4.0 * season + rng.normal(0.0, 2.0, n), 0.0, None),
+        "temp_c": 27.0 - 2.0 * season + rng.normal(0.0, 1.0, n),
+    })
+
+
+def line_list(n_rows: int, n_states: int = 37, years: int = 4, start_year: int = 2018, seed: int = 0) -> Tuple[pd.DataFrame, Dict[float, str]]:
+    """
+    NCDC-style line-list (numeric state codes, M/D/YYYY report dates,
+    case classification) plus the SPSS value labels for the state codes.
+    """
+    rng = np.random.default_rng(seed)
+    labels = {float(i + 1): name.upper() for i, name in enumerate(state_names(n_states))}
+
+    start = pd.Timestamp(f"{start_year}-01-01")
+    days = rng.integers(0, 365 * years, n_rows)
+    dates = (start + pd.to_timedelta(days, unit="D")).strftime("%m/%d/%Y").to_numpy(dtype=object)
+    dates[rng.random(n_rows) < 0.01] = ""  # unparseable report dates
+
+    codes = rng.integers(1, n_states + 1, n_rows).astype(float)
+    codes[rng.random(n_rows) < 0.01] = np.nan
+
+    df = pd.DataFrame({
+        "Stateofresidence_updated_new": codes,
+        "DateofreportMdyyyy": dates,
+        "case_classification_recode": rng.choice([1.0, 2.0, 3.0], n_rows, p=[0.2, 0.7, 0.1]),
+    })
+    return df, labels
+
+
+def weekly_cases(n_states: int, years: int = 4, start_year: int = 2018, seed: int = 0) -> pd.DataFrame:
+    """
+    Sparse weekly state counts, as written by process_lassa_weekly_state.py.
+    Roughly a third of state-weeks have no reported case.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for y in range(start_year, start_year + years):
+        n_weeks = pd.Timestamp(f"{y}-12-28").isocalendar().week
+        rows.extend((y, w) for w in range(1, n_weeks + 1))
+    weeks = pd.DataFrame(rows, columns=["year", "week"])
+
+    df = weeks.merge(pd.DataFrame({"state": state_names(n_states)}), how="cross")
+    df["cases"] = rng.poisson(1.5, len(df))
+    df = df[df["cases"] > 0]
+    return df[["state", "year", "week", "cases"]].reset_index(drop=True)
+
+
+def weekly_panel(n_states: int, years: int = 4, start_year: int = 2018, seed: int = 0) -> pd.DataFrame:
+    """
+    Balanced weekly panel with the columns the app expects:
+    state, year, week, cases, rain_mm, temp_c.
+    """
+    from lassa_model.aggregate import state_daily_to_weekly
+
+    climate = state_daily_to_weekly(state_daily(n_states, years, start_year, seed))
+    cases = weekly_cases(n_states, years, start_year, seed)
+    panel = climate.merge(cases, on=["state", "year", "week"], how="left")
+    panel["cases"] = panel["cases"].fillna(0).astype(int)
+    return panel[["state", "year", "week", "cases", "rain_mm", "temp_c"]].reset_index(drop=True)
@@ -1,6 +1,8 @@
 import os
 import cdsapi
 
+from lassa_model.instrument import RunRecorder
+
 # Nigeria bounding box (N, W, S, E)
 AREA = [14.0, 2.5, 4.0, 15.0]
 OUTDIR = "data/external/era5/daily"
@@ -8,33 +10,37 @@ os.makedirs(OUTDIR, exist_ok=True)
 
 c = cdsapi.Client()
 
-def download_month(year: int, month: int) -> None:
+def download_month(year: int, month: int, run: RunRecorder) -> None:
     outfile = os.path.join(OUTDIR, f"era5_nigeria_{year}_{month:02d}.nc")
     if os.path.exists(outfile):
         print(f"Skipping {year}-{month:02d}, exists: {outfile}")
         return
 
     print(f"Requesting ERA5 hourly (for daily aggregation) for {year}-{month:02d} ...")
-    c.retrieve(
-        "reanalysis-era5-single-levels",
-        {
-            "product_type": "reanalysis",
-            "variable": [
-                "total_precipitation",
-                "2m_temperature",
-            ],
-            "year": str(year),
-            "month": f"{month:02d}",
-            "day": [f"{d:02d}" for d in range(1, 32)],
-            "time": [f"{h:02d}:00" for h in range(24)],
-            "area": AREA,
-            "format": "netcdf",
-        },
-        outfile,
-    )
+    with run.stage("download") as st:
+        st.extra["month"] = f"{year}_{month:02d}"
+        c.retrieve(
+            "reanalysis-era5-single-levels",
+            {
+                "product_type": "reanalysis",
+                "variable": [
+                    "total_precipitation",
+                    "2m_temperature",
+                ],
+                "year": str(year),
+                "month": f"{month:02d}",
+                "day": [f"{d:02d}" for d in range(1, 32)],
+                "time": [f"{h:02d}:00" for h in range(24)],
+                "area": AREA,
+                "format": "netcdf",
+            },
+            outfile,
+        )
+        st.wrote(outfile)
     print(f"Saved: {outfile}")
 
 if __name__ == "__main__":
     # Start with ONE month as a proof-of-download
-    download_month(2021, 1)
+    with RunRecorder("download_era5_daily_nigeria") as run:
+        download_month(2021, 1, run)
 
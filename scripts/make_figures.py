@@ -0,0 +1,4 @@
+from lassa_model.plots import state_reports
+
+if __name__ == "__main__":
+    state_reports()
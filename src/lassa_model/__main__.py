@@ -0,0 +1,5 @@
+import sys
+
+from lassa_model.cli import main
+
+sys.exit(main())
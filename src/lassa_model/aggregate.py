@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import os
+import re
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+import pandas as pd
+
+from lassa_model.config import (
+    ERA5_DAILY_DIR,
+    ERA5_STATE_DAILY_DIR,
+    ERA5_STATE_WEEKLY,
+    ERA5_UNZIP_DIR,
+    ERA5_ZIP_DIR,
+    SHAPEFILE,
+)
+from lassa_model.instrument import RunRecorder
+
+if TYPE_CHECKING:
+    import xarray as xr
+
+STEPS = ("daily", "states", "weekly", "all")
+
+ERA5_STREAMS = (
+    "data_stream-oper_stepType-instant.nc",
+    "data_stream-oper_stepType-accum.nc",
+)
+
+
+def hourly_to_daily(instant: xr.Dataset, accum: xr.Dataset) -> xr.Dataset:
+    """
+    Aggregate ERA5 hourly streams to daily rain_mm (sum) and temp_c (mean).
+    """
+    import xarray as xr
+
+    # ERA5 sometimes uses 'valid_time' instead of 'time'
+    if "valid_time" in instant.coords:
+        instant = instant.rename({"valid_time": "time"})
+    if "valid_time" in accum.coords:
+        accum = accum.rename({"valid_time": "time"})
+
+    # Hourly -> daily
+    t_daily = instant.resample(time="1D").mean()
+    p_daily = accum.resample(time="1D").sum()
+
+    # Unit conversions
+    rain_mm = p_daily["tp"] * 1000.0      # meters -> mm
+    temp_c = t_daily["t2m"] - 273.15      # Kelvin -> Celsius
+
+    return xr.Dataset({"rain_mm": rain_mm, "temp_c": temp_c})
+
+
+def daily_to_states(ds: xr.Dataset, states, name_col: str = "NAME_1") -> pd.DataFrame:
+    """
+    Mean daily rain_mm/temp_c across the grid cells inside each state polygon.
+    states: GeoDataFrame in EPSG:4326 with one row per state.
+    """
+    import rioxarray  # noqa: F401  (registers the .rio accessor)
+
+    # Ensure CRS metadata exists for clipping
+    ds = ds.rio.set_spatial_dims(x_dim="longitude", y_dim="latitude")
+    ds = ds.rio.write_crs("EPSG:4326")
+
+    records = []
+
+    for _, row in states.iterrows():
+        clipped = ds.rio.clip([row.geometry], states.crs, drop=True)
+
+        # mean across grid cells within the polygon for each day
+        df = (
+            clipped[["rain_mm", "temp_c"]]
+            .mean(dim=["latitude", "longitude"], skipna=True)
+            .to_dataframe()
+            .reset_index()
+        )
+
+        df["state"] = row[name_col]
+        records.append(df)
+
+    out = pd.concat(records, ignore_index=True)
+    return out[["state", "time", "rain_mm", "temp_c"]].sort_values(["state", "time"])
+
+
+def state_daily_to_weekly(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    State-daily climate -> ISO year/week totals (rain) and means (temperature).
+    """
+    df = df.copy()
+
+    # ISO year/week
+    iso = df["time"].dt.isocalendar()
+    df["year"] = iso.year
+    df["week"] = iso.week
+
+    weekly = (
+        df.groupby(["state", "year", "week"], as_index=False)
+          .agg(
+              rain_mm=("rain_mm", "sum"),   # weekly total rainfall
+              temp_c=("temp_c", "mean")     # weekly mean temperature
+          )
+    )
+
+    return weekly.sort_values(["state", "year", "week"])
+
+
+# -------------------------
+# Stage runners
+# -------------------------
+def parse_year_month(path) -> str:
+    """
+    Extract YYYY_MM from filenames like:
+    era5_nigeria_2018_01.zip
+    """
+    m = re.search(r"(\d{4}_\d{2})", os.path.basename(str(path)))
+    if not m:
+        raise ValueError(f"Could not parse YYYY_MM from filename: {path}")
+    return m.group(1)
+
+
+def ensure_unzipped(zip_path, out_dir) -> None:
+    """
+    Unzip only if needed.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    existing = set(os.listdir(out_dir))
+    if set(ERA5_STREAMS).issubset(existing):
+        return
+
+    with zipfile.ZipFile(zip_path, "r") as z:
+        z.extractall(out_dir)
+
+
+def zip_month_to_daily(zip_path, run: RunRecorder, out_dir: str = ERA5_DAILY_DIR) -> Path:
+    """
+    ERA5 month zip (two hourly streams) -> daily NetCDF.
+    """
+    import xarray as xr
+
+    if not os.path.exists(zip_path):
+        raise FileNotFoundError(zip_path)
+
+    ym = parse_year_month(zip_path)
+    in_dir = Path(ERA5_UNZIP_DIR) / ym
+    out_file = Path(out_dir) / f"era5_nigeria_{ym}_daily.nc"
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with run.stage("unzip") as st:
+        ensure_unzipped(zip_path, in_dir)
+        st.read(zip_path)
+        st.extra["month"] = ym
+
+    instant_path, accum_path = (in_dir / name for name in ERA5_STREAMS)
+
+    with run.stage("hourly_to_daily") as st:
+        with xr.open_dataset(instant_path, engine="netcdf4") as instant, \
+                xr.open_dataset(accum_path, engine="netcdf4") as accum:
+            out = hourly_to_daily(instant, accum)
+            out.to_netcdf(out_file)
+        st.read(instant_path, accum_path)
+        st.wrote(out_file)
+        st.count(out)
+        st.extra["month"] = ym
+
+    print(f"Saved: {out_file}")
+    return out_file
+
+
+def daily_file_to_states(nc_path, states, run: RunRecorder, out_dir: str = ERA5_STATE_DAILY_DIR) -> Path:
+    """
+    Daily ERA5 NetCDF -> state-daily CSV.
+    states: GeoDataFrame of state polygons in EPSG:4326.
+    """
+    import xarray as xr
+
+    m = re.search(r"era5_nigeria_(\d{4})_(\d{2})_daily\.nc$", str(nc_path))
+    if not m:
+        raise ValueError(f"Cannot extract year/month from filename: {nc_path}")
+
+    year, month = m.group(1), m.group(2)
+    out_file = Path(out_dir) / f"era5_state_daily_{year}_{month}.csv"
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with run.stage("state_aggregation") as st:
+        with xr.open_dataset(nc_path) as ds:
+            out = daily_to_states(ds, states)
+        out.to_csv(out_file, index=False)
+
+        st.read(nc_path)
+        st.wrote(out_file)
+        st.count(out)
+        st.extra["regions"] = len(states)
+
+    print(f"Saved: {out_file}")
+    print("Rows:", len(out), "States:", out['state'].nunique(), "Days:", out['time'].nunique())
+    return out_file
+
+
+def load_states(shapefile: str = SHAPEFILE):
+    import geopandas as gpd
+
+    return gpd.read_file(shapefile).to_crs("EPSG:4326")
+
+
+def state_daily_files_to_weekly(files: Sequence, run: RunRecorder, out_file: str = ERA5_STATE_WEEKLY) -> Path:
+    """
+    All state-daily CSVs -> one state-weekly CSV.
+    """
+    if not files:
+        raise FileNotFoundError("No ERA5 state-daily files found")
+
+    with run.stage("weekly_aggregation") as st:
+        df = pd.concat((pd.read_csv(f, parse_dates=["time"]) for f in files), ignore_index=True)
+
+        weekly = state_daily_to_weekly(df)
+
+        Path(out_file).parent.mkdir(parents=True, exist_ok=True)
+        weekly.to_csv(out_file, index=False)
+
+        st.read(*files)
+        st.wrote(out_file)
+        st.count(weekly)
+        st.extra["input_rows"] = len(df)
+
+    print("Saved:", out_file)
+    print("States:", weekly["state"].nunique())
+    print("Rows:", len(weekly))
+    return Path(out_file)
+
+
+def main(
+    step: str = "all",
+    paths: Optional[List[str]] = None,
+    shapefile: str = SHAPEFILE,
+    run: Optional[RunRecorder] = None,
+) -> None:
+    """
+    Run one aggregation step (or all of them in order).
+    paths: zips for 'daily', daily NetCDFs for 'states', state-daily CSVs for
+    'weekly'; defaults to everything found in the standard data directories.
+    run: recorder to add the stages to, so several steps share one run record;
+    by default each call writes its own.
+    """
+    if step not in STEPS:
+        raise ValueError(f"Unknown step {step!r}; expected one of {STEPS}")
+
+    if run is None:
+        with RunRecorder("aggregate") as run:
+            return main(step, paths, shapefile, run)
+
+    if step in ("daily", "all"):
+        zips = paths if step == "daily" and paths else sorted(Path(ERA5_ZIP_DIR).glob("era5_nigeria_????_??.zip"))
+        if not zips:
+            raise FileNotFoundError(f"No zip files found in {ERA5_ZIP_DIR}")
+        for z in zips:
+            zip_month_to_daily(z, run)
+
+    if step in ("states", "all"):
+        ncs = paths if step == "states" and paths else sorted(Path(ERA5_DAILY_DIR).glob("era5_nigeria_????_??_daily.nc"))
+        if not ncs:
+            raise FileNotFoundError(f"No daily NetCDF files found in {ERA5_DAILY_DIR}")
+        with run.stage("load_boundaries") as st:
+            states = load_states(shapefile)
+            shp = Path(shapefile)
+            st.read(*shp.parent.glob(f"{shp.stem}.*"))  # .shp plus its .dbf/.shx/.prj
+            st.count(states)
+        for nc in ncs:
+            daily_file_to_states(nc, states, run)
+
+    if step in ("weekly", "all"):
+        files = paths if step == "weekly" and paths else sorted(Path(ERA5_STATE_DAILY_DIR).glob("era5_state_daily_*.csv"))
+        state_daily_files_to_weekly(files, run)
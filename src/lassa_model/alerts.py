@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import pandas as pd
+
+
+def add_alerts(
+    df: pd.DataFrame, window: int = 8, z_threshold: float = 2.0, by: Sequence[str] = ("state",)
+) -> pd.DataFrame:
+    """
+    Flag unusually high weekly cases against a rolling per-region baseline.
+    by: key columns of a region, e.g. ["state", "lga"] (LGA names repeat
+    across states). df must be sorted by `by`, year, week.
+    """
+    by = list(by)
+    out = df.copy()
+    roll = out.groupby(by)["cases"].rolling(window, min_periods=window)
+    keys = list(range(len(by)))  # group-key index levels added by rolling
+
+    out["cases_roll_mean"] = roll.mean().reset_index(level=keys, drop=True)
+    out["cases_roll_std"] = roll.std().reset_index(level=keys, drop=True)
+    out["z_cases"] = (out["cases"] - out["cases_roll_mean"]) / out["cases_roll_std"]
+    out["alert"] = (out["z_cases"] >= z_threshold).fillna(False)  # 2-sigma rule (demo)
+    return out
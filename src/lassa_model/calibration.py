@@ -0,0 +1,4 @@
+def main() -> None:
+    # No calibration routine exists yet: SEIR outputs are illustrative and
+    # deliberately not fitted to surveillance data (see README).
+    raise SystemExit("lassa calibrate: no calibration routine is implemented yet")
@@ -0,0 +1,109 @@
+"""
+`lassa` command-line entry point.
+
+Only the standard library is imported here. Each subcommand names the
+function that implements it as "module:function", and that module (with its
+numpy/pandas/xarray/geopandas/scipy/matplotlib imports) is loaded only when
+the subcommand runs, so `lassa --help` and light subcommands start fast.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+from typing import List, Optional
+
+from lassa_model import __version__
+from lassa_model.instrument import PROFILE_ENV, PROFILERS
+
+
+def _run_app(args: List[str]) -> int:
+    # Locate the app without importing it (importing runs the Streamlit script)
+    spec = importlib.util.find_spec("lassa_model.app")
+    cmd = [sys.executable, "-m", "streamlit", "run", spec.origin, *args]
+    return subprocess.call(cmd)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lassa",
+        description="Lassa fever climate-transmission pipeline.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--profile", choices=PROFILERS, help="save a profile for every stage next to its run record")
+    sub = parser.add_subparsers(dest="command", metavar="<command>", required=True)
+
+    p = sub.add_parser("download", help="download monthly ERA5 zips from the Copernicus CDS")
+    p.add_argument("--years", type=int, nargs="+", default=[2018, 2019, 2020, 2021])
+    p.add_argument("--months", type=int, nargs="+", default=list(range(1, 13)))
+    p.set_defaults(target="lassa_model.download:main", keys=("years", "months"))
+
+    p = sub.add_parser("aggregate", help="ERA5 zips -> daily grids -> state daily -> state weekly")
+    p.add_argument("step", nargs="?", default="all", choices=["daily", "states", "weekly", "all"])
+    p.add_argument("paths", nargs="*", help="input files for a single step (default: all found)")
+    p.add_argument("--shapefile", help="state boundaries (default: GADM level 1)")
+    p.set_defaults(target="lassa_model.aggregate:main", keys=("step", "paths", "shapefile"))
+
+    p = sub.add_parser("ingest", help="NCDC line-list -> weekly state counts")
+    p.add_argument("--sav", dest="sav_path", help="SPSS line-list path")
+    p.add_argument("--out", dest="out_file")
+    p.set_defaults(target="lassa_model.panel:ingest", keys=("sav_path", "out_file"))
+
+    p = sub.add_parser("panel", help="weekly state counts -> balanced state x week panel")
+    p.add_argument("--in", dest="in_file")
+    p.add_argument("--shapefile")
+    p.add_argument("--out", dest="out_file")
+    p.set_defaults(target="lassa_model.panel:build", keys=("in_file", "shapefile", "out_file"))
+
+    p = sub.add_parser("simulate", help="run one SEIR scenario and save its trajectory")
+    p.add_argument("--scenario", default="baseline", choices=["baseline", "wetter_climate", "intervention"])
+    p.add_argument("--days", type=int, default=365)
+    p.set_defaults(target="lassa_model.scenarios:simulate", keys=("scenario", "days"))
+
+    p = sub.add_parser("calibrate", help="fit model parameters to surveillance data (not implemented)")
+    p.set_defaults(target="lassa_model.calibration:main", keys=())
+
+    p = sub.add_parser("scenarios", help="run all SEIR scenarios, save a summary table and figure")
+    p.add_argument("--days", type=int, default=365)
+    p.set_defaults(target="lassa_model.scenarios:main", keys=("days",))
+
+    p = sub.add_parser("figures", help="per-state report figures (cases, climate, SEIR signal, alerts)")
+    p.add_argument("--panel", help="weekly model panel CSV")
+    p.add_argument("--out-dir", dest="out_dir")
+    p.add_argument("--states", nargs="+", help="only these states (default: all)")
+    p.add_argument("--by", nargs="+", help="grouping columns, e.g. state lga (default: state)")
+    p.add_argument("--window", type=int, help="alert baseline window in weeks (default: 8)")
+    p.add_argument("--workers", type=int, help="render processes (default: CPU count)")
+    p.add_argument("--force", action="store_true", help="redraw figures even if their data is unchanged")
+    p.set_defaults(target="lassa_model.plots:state_reports", keys=("panel", "out_dir", "states", "by", "window", "workers", "force"))
+
+    p = sub.add_parser("app", help="launch the Streamlit early warning app", add_help=False)
+    p.set_defaults(target=None)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _build_parser()
+    args, extra = parser.parse_known_args(argv)
+
+    if args.command == "app":
+        return _run_app(extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+
+    if args.profile:
+        os.environ[PROFILE_ENV] = args.profile
+
+    module, func = args.target.split(":")
+    # Unset options fall back to the function's own defaults (lassa_model.config)
+    kwargs = {k: getattr(args, k) for k in args.keys if getattr(args, k) not in (None, [])}
+    getattr(importlib.import_module(module), func)(**kwargs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
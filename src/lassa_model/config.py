@@ -0,0 +1,25 @@
+"""
+Default input/output locations, relative to the repository root.
+"""
+
+# Nigeria bounding box in CDS order: [North, West, South, East]
+NGA_BBOX = [14.0, 2.5, 4.0, 15.0]
+
+# Raw inputs (see data/external/README.md)
+ERA5_ZIP_DIR = "data/external/era5/daily"
+ERA5_UNZIP_DIR = "data/external/era5/daily/unzipped"
+LASSA_SAV = "data/external/lassa/Lassa Fever_Dataset_NCDC.sav"
+SHAPEFILE = "data/external/boundaries/gadm41_NGA_1.shp"
+
+# Processed data
+ERA5_DAILY_DIR = "data/processed/era5/daily"
+ERA5_STATE_DAILY_DIR = "data/processed/era5/state_daily"
+ERA5_STATE_WEEKLY = "data/processed/era5/era5_state_weekly_2018_2021.csv"
+LASSA_WEEKLY = "data/processed/lassa/lassa_weekly_state_2018_2021.csv"
+LASSA_WEEKLY_BALANCED = "data/processed/lassa/lassa_weekly_state_2018_2021_balanced.csv"
+MODEL_PANEL = "data/processed/model/lassa_era5_weekly_panel_2018_2021.csv"
+
+# Outputs
+FIGURES_DIR = "outputs/figures"
+STATE_FIGURES_DIR = "outputs/figures/states"
+TABLES_DIR = "outputs/tables"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from lassa_model.config import ERA5_ZIP_DIR, NGA_BBOX
+from lassa_model.instrument import RunRecorder
+
+YEARS = [2018, 2019, 2020, 2021]
+MONTHS = list(range(1, 13))
+
+# Keep this small to avoid queue pain:
+# We'll request just what we need for modelling
+VARS_INSTANT = ["2m_temperature"]
+VARS_ACCUM = ["total_precipitation"]
+
+
+def download_month(client, year: int, month: int, run: RunRecorder, out_dir: str = ERA5_ZIP_DIR) -> Path:
+    ym = f"{year}_{month:02d}"
+    outzip = Path(out_dir) / f"era5_nigeria_{ym}.zip"
+
+    if outzip.exists() and outzip.stat().st_size > 0:
+        print(f"Skip (exists): {outzip}")
+        return outzip
+
+    print(f"Requesting ERA5 month for {ym} ...")
+
+    # CDS often returns a ZIP when multiple streams are requested.
+    # We request both variables in a single call (works for your pipeline).
+    with run.stage("download") as st:
+        st.extra["month"] = ym
+        client.retrieve(
+            "reanalysis-era5-single-levels",
+            {
+                "product_type": "reanalysis",
+                "variable": VARS_INSTANT + VARS_ACCUM,
+                "year": str(year),
+                "month": f"{month:02d}",
+                "day": [f"{d:02d}" for d in range(1, 32)],
+                "time": [f"{h:02d}:00" for h in range(0, 24)],
+                "area": NGA_BBOX,
+                "format": "netcdf",  # CDS may still wrap into a zip depending on stream separation
+            },
+            str(outzip),
+        )
+        st.wrote(outzip)
+    print(f"Saved: {outzip}")
+    return outzip
+
+
+def main(years: Iterable[int] = YEARS, months: Iterable[int] = MONTHS, out_dir: str = ERA5_ZIP_DIR) -> None:
+    import cdsapi
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    client = cdsapi.Client()
+
+    with RunRecorder("download") as run:
+        for y in years:
+            for m in months:
+                download_month(client, y, m, run, out_dir)
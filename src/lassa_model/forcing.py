@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ForcingParams:
+    beta0: float
+    season_amp: float
+    season_phase: float
+    climate_coeff: float
+
+
+def seasonal_factor(t: float, amp: float, phase: float) -> float:
+    return 1.0 + amp * np.sin(2.0 * np.pi * (t - phase) / 365.0)
+
+
+def climate_index(t: float, shock: float = 0.0) -> float:
+    return np.sin(2.0 * np.pi * t / 365.0) + shock
+
+
+def make_beta_function(forcing: ForcingParams, climate_shock: float = 0.0, intervention_start: float | None = None, intervention_effect: float = 0.0) -> Callable[[float], float]:
+    def beta_t(t: float) -> float:
+        seas = seasonal_factor(t, forcing.season_amp, forcing.season_phase)
+        clim = climate_index(t, shock=climate_shock)
+        clim_term = np.exp(forcing.climate_coeff * clim)
+        beta = forcing.beta0 * seas * clim_term
+
+        if intervention_start is not None and t >= intervention_start:
+            beta = beta * (1.0 - intervention_effect)
+
+        return float(max(beta, 0.0))
+
+    return beta_t
+
+
+def climate_forcing(rain, temp, a_rain: float = 0.15, a_temp: float = 0.10) -> np.ndarray:
+    """
+    Weekly multiplier on beta0 from standardized rainfall and temperature:
+    F(t) = exp(a_rain * Z_rain + a_temp * Z_temp), normalized to mean 1
+    (see docs/model_equations.md). Weeks with missing climate count as average.
+    """
+    def z(x):
+        x = np.asarray(x, dtype=float)
+        sd = np.nanstd(x)
+        if not sd > 0:
+            return np.zeros_like(x)
+        return np.nan_to_num((x - np.nanmean(x)) / sd)
+
+    forcing = np.exp(a_rain * z(rain) + a_temp * z(temp))
+    return forcing / forcing.mean()
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RUNS_DIR = "outputs/runs"
+
+# Set LASSA_RUN_ID to group records from several scripts/subprocesses
+# under one run directory; LASSA_PROFILE selects a profiler for every stage.
+RUN_ID_ENV = "LASSA_RUN_ID"
+PROFILE_ENV = "LASSA_PROFILE"
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+# Numbers recorders within a process so two with the same name don't share a file
+_recorder_seq = itertools.count(1)
+
+
+# Linux: clear_refs also resets what ru_maxrss reports, so the process-wide
+# peak is carried here across resets
+_process_peak_mb = 0.0
+
+
+def _process_peak_rss_mb() -> Optional[float]:
+    """Peak RSS of the whole process so far."""
+    global _process_peak_mb
+    for peak in (_stage_peak_rss_mb(), _ru_maxrss_mb()):
+        if peak is not None:
+            _process_peak_mb = max(_process_peak_mb, peak)
+    return _process_peak_mb or None
+
+
+def _ru_maxrss_mb(who: str = "RUSAGE_SELF") -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _children_cpu_s() -> float:
+    """CPU time of terminated, waited-for child processes (e.g. pool workers)."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _reset_peak_rss() -> bool:
+    """
+    Reset the kernel's RSS high-water mark (VmHWM) to the current RSS.
+    Linux only; returns False where that is not possible.
+    """
+    _process_peak_rss_mb()  # keep the peak so far before it is cleared
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _stage_peak_rss_mb() -> Optional[float]:
+    """VmHWM from /proc/self/status, i.e. the peak since the last reset."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024  # kB
+    except OSError:
+        pass
+    return None
+
+
+def _file_size(path) -> int:
+    path = Path(path)
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+@dataclass
+class StageRecord:
+    stage: str
+    started_at: str = ""
+    wall_s: float = 0.0
+    cpu_s: float = 0.0  # this process plus child processes joined during the stage
+    peak_rss_mb: Optional[float] = None  # this stage only; None where unsupported
+    process_peak_rss_mb: Optional[float] = None  # whole process up to the end of this stage
+    children_peak_rss_mb: Optional[float] = None  # largest joined child process so far
+    bytes_read: int = 0
+    bytes_written: int = 0
+    rows: int = 0
+    cells: int = 0
+    status: str = "running"
+    error: Optional[str] = None
+    profile_path: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def read(self, *paths) -> None:
+        """Add the on-disk size of input files (or directories) to bytes_read."""
+        self.bytes_read += sum(_file_size(p) for p in paths)
+
+    def wrote(self, *paths) -> None:
+        """Add the on-disk size of output files (or directories) to bytes_written."""
+        self.bytes_written += sum(_file_size(p) for p in paths)
+
+    def count(self, obj) -> None:
+        """
+        Add rows/cells of a DataFrame, array or xarray Dataset.
+        For a Dataset, rows are time steps and cells are values across data variables.
+        """
+        if hasattr(obj, "data_vars"):
+            self.rows += int(obj.sizes.get("time", 0))
+            self.cells += int(sum(v.size for v in obj.data_vars.values()))
+        else:
+            self.rows += len(obj)
+            self.cells += int(getattr(obj, "size", len(obj)))
+
+
+class RunRecorder:
+    """
+    Collects per-stage timings for one script invocation and writes them to
+    outputs/runs/<run_id>/<name>_<pid>_<n>.json (and .parquet when a parquet
+    engine is installed), n counting recorders within the process.
+
+        with RunRecorder("process_lassa_weekly_state") as run:
+            with run.stage("ingest_line_list") as st:
+                df = pd.read_csv(path)
+                st.read(path)
+                st.count(df)
+    """
+
+    def __init__(self, name: str, runs_dir: str = RUNS_DIR, run_id: Optional[str] = None, profile: Optional[str] = None):
+        self.name = name
+        self.run_id = run_id or os.environ.get(RUN_ID_ENV) or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.run_dir = Path(runs_dir) / self.run_id
+        self.profile = profile if profile is not None else os.environ.get(PROFILE_ENV) or None
+        if self.profile is not None and self.profile not in PROFILERS:
+            raise ValueError(f"Unknown profiler {self.profile!r}; expected one of {PROFILERS}")
+
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.file_stem = f"{name}_{os.getpid()}_{next(_recorder_seq)}"
+        self.status = "running"
+        self.stages: List[StageRecord] = []
+
+    def __enter__(self) -> "RunRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.status = "ok" if exc_type is None else "failed"
+        self.write()
+
+    @contextmanager
+    def stage(self, name: str, profile: Optional[str] = None) -> Iterator[StageRecord]:
+        rec = StageRecord(stage=name, started_at=datetime.now().isoformat(timespec="seconds"))
+        self.stages.append(rec)
+        profiler = self._start_profiler(profile or self.profile)
+        # Stages are not nested, so resetting the high-water mark here is safe
+        per_stage_rss = _reset_peak_rss()
+
+        wall0 = time.perf_counter()
+        cpu0 = time.process_time() + _children_cpu_s()
+        try:
+            yield rec
+            rec.status = "ok"
+        except BaseException as e:
+            rec.status = "failed"
+            rec.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            rec.wall_s = time.perf_counter() - wall0
+            rec.cpu_s = time.process_time() + _children_cpu_s() - cpu0
+            if per_stage_rss:
+                rec.peak_rss_mb = _stage_peak_rss_mb()
+            rec.process_peak_rss_mb = _process_peak_rss_mb()
+            rec.children_peak_rss_mb = _ru_maxrss_mb("RUSAGE_CHILDREN") or None
+            if profiler is not None:
+                rec.profile_path = self._stop_profiler(profiler, name)
+
+    def _start_profiler(self, kind: Optional[str]):
+        if kind is None:
+            return None
+        if kind == "cprofile":
+            import cProfile
+
+            prof = cProfile.Profile()
+            prof.enable()
+        elif kind == "pyinstrument":
+            from pyinstrument import Profiler  # optional sampling profiler
+
+            prof = Profiler()
+            prof.start()
+        else:
+            raise ValueError(f"Unknown profiler {kind!r}; expected one of {PROFILERS}")
+        return kind, prof
+
+    def _stop_profiler(self, profiler, stage: str) -> str:
+        kind, prof = profiler
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.run_dir / f"{self.file_stem}_{stage}"
+        if kind == "cprofile":
+            prof.disable()
+            path = stem.with_suffix(".prof")
+            prof.dump_stats(path)
+        else:
+            prof.stop()
+            path = stem.with_suffix(".html")
+            path.write_text(prof.output_html())
+        return str(path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "argv": sys.argv,
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def write(self) -> Path:
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.run_dir / self.file_stem
+        record = self.to_dict()
+
+        json_path = stem.with_suffix(".json")
+        json_path.write_text(json.dumps(record, indent=2, default=str))
+
+        if self.stages:
+            import pandas as pd
+
+            table = pd.DataFrame(record["stages"]).drop(columns=["extra"])
+            table.insert(0, "name", self.name)
+            table.insert(0, "run_id", self.run_id)
+            try:
+                table.to_parquet(stem.with_suffix(".parquet"), index=False)
+            except ImportError:
+                pass  # no parquet engine installed; the JSON record is complete
+
+        return json_path
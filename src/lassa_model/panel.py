@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Sequence
+
+import pandas as pd
+
+from lassa_model.config import LASSA_SAV, LASSA_WEEKLY, LASSA_WEEKLY_BALANCED, SHAPEFILE
+from lassa_model.instrument import RunRecorder
+
+
+def weekly_state_counts(df: pd.DataFrame, state_labels: Dict) -> pd.DataFrame:
+    """
+    NCDC line-list -> confirmed cases per state and ISO year/week.
+    state_labels: SPSS value labels for Stateofresidence_updated_new.
+    """
+    df = df.copy()
+
+    # Map numeric codes to names
+    df["state"] = df["Stateofresidence_updated_new"].map(state_labels)
+
+    # Fix capitalization / consistency
+    df["state"] = (
+        df["state"]
+        .str.strip()
+        .str.title()
+        .replace({
+            "Fct": "Federal Capital Territory",
+            "Akwa-Ibom": "Akwa Ibom"
+        })
+    )
+
+    # Parse report date
+    df["report_date"] = pd.to_datetime(
+        df["DateofreportMdyyyy"],
+        errors="coerce"
+    )
+
+    # Keep confirmed cases only
+    df = df[df["case_classification_recode"] == 1]
+
+    # Drop rows without state or date
+    df = df.dropna(subset=["state", "report_date"])
+
+    # Derive ISO year and week
+    iso = df["report_date"].dt.isocalendar()
+    df["year"] = iso.year
+    df["week"] = iso.week
+
+    # Aggregate to weekly state counts
+    return (
+        df.groupby(["state", "year", "week"])
+          .size()
+          .reset_index(name="cases")
+    )
+
+
+def balanced_panel(df: pd.DataFrame, states: Sequence[str]) -> pd.DataFrame:
+    """
+    Expand weekly state counts to the full state × year × week grid,
+    filling weeks without reports with zero cases.
+    """
+    # Determine ISO year/week range
+    min_year = int(df["year"].min())
+    max_year = int(df["year"].max())
+
+    weeks = []
+    for y in range(min_year, max_year + 1):
+        for w in range(1, 54):
+            try:
+                pd.Timestamp.fromisocalendar(y, w, 1)
+                weeks.append((y, w))
+            except ValueError:
+                pass
+
+    weeks = pd.DataFrame(weeks, columns=["year", "week"])
+
+    # Full state × year × week grid
+    panel = (
+        pd.MultiIndex.from_product(
+            [states, weeks["year"].unique(), weeks["week"].unique()],
+            names=["state", "year", "week"]
+        )
+        .to_frame(index=False)
+    )
+
+    # Merge observed cases
+    out = panel.merge(df, on=["state", "year", "week"], how="left")
+    out["cases"] = out["cases"].fillna(0).astype(int)
+
+    return out.sort_values(["state", "year", "week"])
+
+
+# -------------------------
+# Stage runners
+# -------------------------
+def ingest(sav_path: str = LASSA_SAV, out_file: str = LASSA_WEEKLY) -> pd.DataFrame:
+    """
+    NCDC SPSS line-list -> weekly state counts CSV.
+    """
+    import pyreadstat
+
+    with RunRecorder("ingest") as run:
+        with run.stage("line_list_ingestion") as st:
+            # Load Lassa line-list
+            df, meta = pyreadstat.read_sav(sav_path)
+
+            # Extract state labels
+            state_labels = meta.variable_value_labels["Stateofresidence_updated_new"]
+
+            weekly = weekly_state_counts(df, state_labels)
+
+            Path(out_file).parent.mkdir(parents=True, exist_ok=True)
+            weekly.to_csv(out_file, index=False)
+
+            st.read(sav_path)
+            st.wrote(out_file)
+            st.count(weekly)
+            st.extra["input_rows"] = len(df)
+
+    print("Saved:", out_file)
+    print("Rows:", len(weekly))
+    print("States:", weekly["state"].nunique())
+    print("Years:", weekly["year"].unique())
+    return weekly
+
+
+def build(in_file: str = LASSA_WEEKLY, shapefile: str = SHAPEFILE, out_file: str = LASSA_WEEKLY_BALANCED) -> pd.DataFrame:
+    """
+    Weekly state counts -> balanced state × year × week panel CSV,
+    using the shapefile's NAME_1 values as the canonical state list.
+    """
+    import geopandas as gpd
+
+    with RunRecorder("panel") as run:
+        with run.stage("panel_build") as st:
+            df = pd.read_csv(in_file)
+
+            # Canonical state list from shapefile (attributes only, no geometry)
+            shape = gpd.read_file(shapefile, columns=["NAME_1"], ignore_geometry=True)
+            states = sorted(shape["NAME_1"].str.strip().unique())
+
+            out = balanced_panel(df, states)
+
+            Path(out_file).parent.mkdir(parents=True, exist_ok=True)
+            out.to_csv(out_file, index=False)
+
+            # Only the attribute table (.dbf, and its .cpg encoding) is read
+            dbf = Path(shapefile).with_suffix(".dbf")
+            st.read(in_file, dbf, dbf.with_suffix(".cpg"))
+            st.wrote(out_file)
+            st.count(out)
+
+    print("Saved:", out_file)
+    print("States:", out["state"].nunique())
+    print("Years:", out["year"].nunique())
+    print("Total rows:", len(out))
+    print("Total confirmed cases:", out["cases"].sum())
+    return out
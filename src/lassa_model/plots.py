@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+from lassa_model.config import FIGURES_DIR, MODEL_PANEL, STATE_FIGURES_DIR
+from lassa_model.instrument import RunRecorder
+
+# Bump when the report layout changes so cached figures are redrawn
+RENDER_VERSION = 2
+
+CACHE_FILE = ".figure_cache.json"
+
+
+def plot_cases_vs_rain(sub, state: str):
+    """
+    Weekly cases (left axis) against rainfall (right axis) for one state.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax1 = plt.subplots(figsize=(10,4))
+
+    ax1.plot(sub["week"], sub["cases"])
+    ax1.set_ylabel("Lassa cases")
+
+    ax2 = ax1.twinx()
+    ax2.plot(sub["week"], sub["rain_mm"], alpha=0.5)
+    ax2.set_ylabel("Rainfall (mm)")
+
+    ax1.set_title(f"Lassa cases vs rainfall – {state}")
+    fig.tight_layout()
+    return fig
+
+
+def cases_vs_rain(state: str = "Edo", panel: str = MODEL_PANEL, out_dir: str = FIGURES_DIR, show: bool = False) -> str:
+    import matplotlib
+
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f"lassa_vs_rain_{state.replace(' ', '_')}.png")
+
+    with RunRecorder("figures") as run:
+        with run.stage("figures") as st:
+            df = pd.read_csv(panel)
+            sub = df[df["state"] == state]
+            if sub.empty:
+                raise ValueError(f"No rows for state {state!r} in {panel}")
+
+            fig = plot_cases_vs_rain(sub, state)
+            fig.savefig(out_path, dpi=150)
+            if show:
+                plt.show()
+            plt.close(fig)
+
+            st.read(panel)
+            st.wrote(out_path)
+            st.count(sub)
+            st.extra["figures"] = 1
+
+    print(f"Saved: {out_path}")
+    return out_path
+
+
+# -------------------------
+# Figure cache
+# -------------------------
+def data_hash(*parts) -> str:
+    """
+    sha256 over DataFrames/Series, numpy arrays, bytes or JSON-able values.
+    """
+    import numpy as np
+    import pandas as pd
+
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            part = pd.util.hash_pandas_object(part, index=False).to_numpy()
+        if isinstance(part, np.ndarray):
+            h.update(np.ascontiguousarray(part).tobytes())
+        elif isinstance(part, bytes):
+            h.update(part)
+        else:
+            h.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+class FigureCache:
+    """
+    Maps figure file names in out_dir to the hash of the data they were drawn
+    from, stored in out_dir/.figure_cache.json.
+    """
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self.path = os.path.join(out_dir, CACHE_FILE)
+        try:
+            with open(self.path) as f:
+                self.hashes: Dict[str, str] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.hashes = {}
+
+    def is_fresh(self, name: str, digest: str) -> bool:
+        return self.hashes.get(name) == digest and os.path.exists(os.path.join(self.out_dir, name))
+
+    def update(self, name: str, digest: str) -> None:
+        self.hashes[name] = digest
+
+    def save(self) -> None:
+        os.makedirs(self.out_dir, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.hashes, f, indent=0, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+# -------------------------
+# Per-state report figures
+# -------------------------
+# One figure per process, built on first use and redrawn for every state
+_REPORT = None
+
+
+def _report_figure():
+    """
+    Five stacked panels drawn on the Agg canvas directly (no pyplot, no GUI
+    backend). Artists are created once and only their data changes per state.
+    """
+    global _REPORT
+    if _REPORT is not None:
+        return _REPORT
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import MaxNLocator, MultipleLocator
+
+    fig = Figure(figsize=(8, 9), dpi=100)
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(5, 1, sharex=True)
+    fig.subplots_adjust(left=0.11, right=0.97, top=0.94, bottom=0.06, hspace=0.15)
+
+    cases, = axes[0].plot([], [], color="black", lw=1.0)
+    axes[0].set_ylabel("Cases")
+    rain, = axes[1].plot([], [], color="tab:blue", lw=1.0)
+    axes[1].set_ylabel("Rain (mm)")
+    temp, = axes[2].plot([], [], color="tab:red", lw=1.0)
+    axes[2].set_ylabel("Temp (°C)")
+    seir, = axes[3].plot([], [], color="tab:purple", lw=1.0)
+    axes[3].set_ylabel("SEIR signal")
+    z, = axes[4].plot([], [], color="grey", lw=1.0)
+    alerts, = axes[4].plot([], [], "o", color="tab:red", ms=3)
+    threshold = axes[4].axhline(0.0, color="tab:red", ls="--", lw=0.8)
+    axes[4].set_ylabel("z (cases)")
+    axes[4].set_xlabel("Year")
+    title = fig.suptitle("")
+
+    # Tick labels are most of the draw time; keep them few
+    axes[4].xaxis.set_major_locator(MultipleLocator(1))
+    for ax in axes:
+        ax.yaxis.set_major_locator(MaxNLocator(3))
+
+    _REPORT = {
+        "fig": fig,
+        "axes": axes,
+        "lines": {"cases": cases, "rain": rain, "temp": temp, "seir": seir, "z": z, "alerts": alerts},
+        "threshold": threshold,
+        "title": title,
+    }
+    return _REPORT
+
+
+def render_state(task: Dict) -> str:
+    """
+    Draw and save one state's report. task holds the state's arrays
+    (x, cases, rain, temp, seir, z, alert), z_threshold, title and out_path.
+    """
+    report = _report_figure()
+    lines = report["lines"]
+    x = task["x"]
+
+    lines["cases"].set_data(x, task["cases"])
+    lines["rain"].set_data(x, task["rain"])
+    lines["temp"].set_data(x, task["temp"])
+    lines["seir"].set_data(x, task["seir"])
+    lines["z"].set_data(x, task["z"])
+    lines["alerts"].set_data(x[task["alert"]], task["z"][task["alert"]])
+    report["threshold"].set_ydata([task["z_threshold"]] * 2)
+    report["title"].set_text(task["title"])
+
+    for ax in report["axes"]:
+        ax.relim()
+        ax.autoscale_view()
+
+    # Fast zlib level: ~4x quicker to encode, slightly larger files
+    report["fig"].savefig(task["out_path"], pil_kwargs={"compress_level": 1})
+    return task["out_path"]
+
+
+def _file_stem(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in str(name))
+
+
+def _iso_week_x(year, week):
+    """
+    Fractional year for ISO year/week Series, dividing by the ISO weeks in
+    each year (52 or 53) so week 53 stays before the next year's week 1.
+    """
+    import pandas as pd
+
+    # 28 December always falls in the last ISO week of its year
+    weeks_in_year = pd.to_datetime(year.astype(str) + "-12-28").dt.isocalendar().week.to_numpy(dtype=float)
+    return year.to_numpy(dtype=float) + (week.to_numpy(dtype=float) - 1) / weeks_in_year
+
+
+def report_tasks(
+    df,
+    out_dir: str,
+    cache: Optional[FigureCache] = None,
+    by: Sequence[str] = ("state",),
+    window: int = 8,
+    z_threshold: float = 2.0,
+):
+    """
+    Per-region render tasks for a weekly panel (`by` key columns, year, week,
+    cases, rain_mm, temp_c). Regions whose data hash is fresh in `cache` are
+    left out. Returns (tasks, number skipped).
+    """
+    import pandas as pd
+
+    from lassa_model.alerts import add_alerts
+    from lassa_model.forcing import climate_forcing
+    from lassa_model.model import seir_weekly
+
+    by = list(by)
+    settings = {"version": RENDER_VERSION, "window": window, "z_threshold": z_threshold}
+
+    df = df.sort_values([*by, "year", "week"]).reset_index(drop=True)
+    df = add_alerts(df, window=window, z_threshold=z_threshold, by=by)
+
+    # Row hashes once for the whole panel, sliced per state below
+    row_hash = pd.util.hash_pandas_object(
+        df[[*by, "year", "week", "cases", "rain_mm", "temp_c"]], index=False
+    ).to_numpy()
+
+    tasks = []
+    skipped = 0
+    for key, idx in df.groupby(by, sort=True).indices.items():
+        key = key if isinstance(key, tuple) else (key,)
+        name = "_".join(_file_stem(k) for k in key) + ".png"
+        digest = data_hash(row_hash[idx], settings)
+        if cache is not None and cache.is_fresh(name, digest):
+            skipped += 1
+            continue
+
+        sub = df.iloc[idx]
+        rain = sub["rain_mm"].to_numpy(dtype=float)
+        temp = sub["temp_c"].to_numpy(dtype=float)
+        _, _, I, _ = seir_weekly(len(sub), climate_forcing(rain, temp))
+        tasks.append({
+            "name": name,
+            "digest": digest,
+            "out_path": os.path.join(out_dir, name),
+            "title": f"{' / '.join(map(str, key))}: weekly cases, climate and early warning signals",
+            "x": _iso_week_x(sub["year"], sub["week"]),
+            "cases": sub["cases"].to_numpy(dtype=float),
+            "rain": rain,
+            "temp": temp,
+            "seir": I / I.max() if I.max() > 0 else I,
+            "z": sub["z_cases"].to_numpy(dtype=float),
+            "alert": sub["alert"].to_numpy(dtype=bool),
+            "z_threshold": z_threshold,
+        })
+
+    return tasks, skipped
+
+
+def state_reports(
+    panel: str = MODEL_PANEL,
+    out_dir: str = STATE_FIGURES_DIR,
+    states: Optional[Sequence[str]] = None,
+    by: Sequence[str] = ("state",),
+    window: int = 8,
+    z_threshold: float = 2.0,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> List[str]:
+    """
+    Render cases, rain, temperature, SEIR signal and alert small multiples for
+    every state (or LGA, with by=["state", "lga"]) in a weekly panel, one PNG
+    each. `states` keeps only rows whose first `by` key is listed.
+
+    Figures whose input rows and settings hash to the value recorded in
+    out_dir/.figure_cache.json are skipped unless force=True. Stale figures
+    are drawn on a process pool of `workers` processes (default: CPU count).
+    """
+    import pandas as pd
+
+    os.makedirs(out_dir, exist_ok=True)
+    cache = FigureCache(out_dir)
+
+    with RunRecorder("figures") as run:
+        with run.stage("prepare") as st:
+            df = pd.read_csv(panel)
+            if states is not None:
+                df = df[df[by[0]].isin(states)]
+
+            tasks, skipped = report_tasks(
+                df, out_dir, cache=None if force else cache, by=by, window=window, z_threshold=z_threshold
+            )
+
+            st.read(panel)
+            st.count(df)
+            st.extra.update({"groups": len(tasks) + skipped, "stale": len(tasks), "skipped": skipped})
+
+        with run.stage("figures") as st:
+            workers = workers or os.cpu_count() or 1
+            workers = min(workers, len(tasks))
+
+            if workers <= 1:
+                paths = [render_state(t) for t in tasks]
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+
+                chunksize = max(1, len(tasks) // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    paths = list(pool.map(render_state, tasks, chunksize=chunksize))
+
+            # Only record hashes once the PNGs exist
+            for t in tasks:
+                cache.update(t["name"], t["digest"])
+            cache.save()
+
+            st.wrote(*paths)
+            st.extra.update({"figures": len(paths), "workers": workers})
+
+    print(f"Figures: {len(paths)} drawn, {skipped} unchanged, in {out_dir}")
+    return paths
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+
+from lassa_model.config import FIGURES_DIR, TABLES_DIR
+from lassa_model.forcing import ForcingParams, make_beta_function
+from lassa_model.instrument import RunRecorder
+from lassa_model.model import SEIRParams
+from lassa_model.plots import FigureCache, data_hash
+
+N = 1_000_000.0
+I0, E0, R0 = 10.0, 20.0, 0.0
+
+EPI = SEIRParams(sigma=1.0 / 10.0, gamma=1.0 / 14.0)
+
+FORCING = ForcingParams(
+    beta0=0.35,
+    season_amp=0.20,
+    season_phase=30.0,
+    climate_coeff=0.25,
+)
+
+SCENARIOS = {
+    "baseline": dict(climate_shock=0.0, intervention_start=None, intervention_effect=0.0),
+    "wetter_climate": dict(climate_shock=0.5, intervention_start=None, intervention_effect=0.0),
+    "intervention": dict(climate_shock=0.0, intervention_start=180.0, intervention_effect=0.30),
+}
+
+
+def ensure_dirs() -> None:
+    os.makedirs(FIGURES_DIR, exist_ok=True)
+    os.makedirs(TABLES_DIR, exist_ok=True)
+
+
+def run_scenario(name: str, days: int = 365) -> Dict[str, np.ndarray]:
+    from lassa_model.simulate import simulate_seir
+
+    if name not in SCENARIOS:
+        raise ValueError(f"Unknown scenario {name!r}; expected one of {sorted(SCENARIOS)}")
+
+    sc = SCENARIOS[name]
+    t_days = np.arange(0, days + 1, 1)
+    y0 = (N - I0 - E0 - R0, E0, I0, R0)
+
+    beta_t = make_beta_function(
+        forcing=FORCING,
+        climate_shock=sc["climate_shock"],
+        intervention_start=sc["intervention_start"],
+        intervention_effect=sc["intervention_effect"],
+    )
+    return simulate_seir(t_days=t_days, y0=y0, N=N, params=EPI, beta_t=beta_t)
+
+
+def simulate(scenario: str = "baseline", days: int = 365) -> str:
+    """
+    Run one scenario and save its daily S/E/I/R trajectory.
+    """
+    import pandas as pd
+
+    ensure_dirs()
+    out_path = os.path.join(TABLES_DIR, f"seir_{scenario}.csv")
+
+    with RunRecorder("simulate") as run:
+        with run.stage("simulation") as st:
+            res = run_scenario(scenario, days)
+            df = pd.DataFrame(res)
+            df.to_csv(out_path, index=False)
+
+            st.wrote(out_path)
+            st.count(df)
+            st.extra["scenarios"] = [scenario]
+
+    print(f"Saved: {out_path}")
+    return out_path
+
+
+def main(days: int = 365) -> None:
+    """
+    Run every scenario, save a timestamped peak summary table and the
+    infectious curves figure. The figure is only redrawn when the simulated
+    curves change.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    ensure_dirs()
+
+    outputs: Dict[str, Dict[str, np.ndarray]] = {}
+
+    with RunRecorder("scenarios") as run:
+        with run.stage("simulation") as st:
+            for name in SCENARIOS:
+                outputs[name] = run_scenario(name, days)
+
+            # Save summary CSV
+            rows = []
+            for name, res in outputs.items():
+                I = res["I"]
+                peak_I = float(I.max())
+                peak_day = int(res["t"][int(I.argmax())])
+                rows.append({"scenario": name, "peak_I": peak_I, "peak_day": peak_day})
+
+            df = pd.DataFrame(rows).sort_values("scenario")
+
+            # A new table per run keeps the peak history; the figure is cached
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            table_path = os.path.join(TABLES_DIR, f"summary_{stamp}.csv")
+            fig_name = "infectious_curves.png"
+            fig_path = os.path.join(FIGURES_DIR, fig_name)
+
+            df.to_csv(table_path, index=False)
+
+            st.wrote(table_path)
+            st.rows = sum(len(res["t"]) for res in outputs.values())
+            st.cells = st.rows * 4  # S, E, I, R
+            st.extra["scenarios"] = list(SCENARIOS)
+
+        with run.stage("figures") as st:
+            cache = FigureCache(FIGURES_DIR)
+            digest = data_hash(*(res["I"] for res in outputs.values()), list(outputs))
+
+            if cache.is_fresh(fig_name, digest):
+                st.extra["figures"] = 0
+            else:
+                # Plot
+                plt.figure()
+                for name, res in outputs.items():
+                    plt.plot(res["t"], res["I"], label=name)
+                plt.xlabel("Day")
+                plt.ylabel("Infectious (I)")
+                plt.title("SEIR simulations with seasonal + climate forcing")
+                plt.legend()
+                plt.tight_layout()
+                plt.savefig(fig_path, dpi=200)
+                plt.close()
+
+                cache.update(fig_name, digest)
+                cache.save()
+                st.wrote(fig_path)
+                st.extra["figures"] = 1
+
+    print("Done.")
+    print(f"Saved: {table_path}")
+    if st.extra["figures"]:
+        print(f"Saved: {fig_path}")
+    else:
+        print(f"Unchanged: {fig_path}")
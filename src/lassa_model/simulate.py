@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from lassa_model.model import SEIRParams, seir_rhs
+
+
+def simulate_seir(t_days: np.ndarray, y0: Tuple[float, float, float, float], N: float, params: SEIRParams, beta_t: Callable[[float], float]) -> Dict[str, np.ndarray]:
+    sol = solve_ivp(
+        fun=lambda t, y: seir_rhs(t, y, N=N, params=params, beta_t=beta_t),
+        t_span=(float(t_days[0]), float(t_days[-1])),
+        y0=np.array(y0, dtype=float),
+        t_eval=t_days,
+        method="RK45",
+        rtol=1e-7,
+        atol=1e-9,
+    )
+    if not sol.success:
+        raise RuntimeError(sol.message)
+
+    S, E, I, R = sol.y
+    return {"t": t_days, "S": S, "E": E, "I": I, "R": R}
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from lassa_model.cli import main
+
+HEAVY = ["numpy", "pandas", "scipy", "xarray", "geopandas", "rioxarray", "matplotlib"]
+
+
+def test_cli_import_is_stdlib_only():
+    code = (
+        "import sys, lassa_model.cli; "
+        f"print([m for m in {HEAVY!r} if m in sys.modules])"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_panel_module_defers_geopandas_until_build():
+    code = (
+        "import sys, lassa_model.panel; "
+        "print([m for m in ['geopandas', 'shapely', 'pyproj'] if m in sys.modules])"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_panel_uses_shapefile_state_names(tmp_path, monkeypatch):
+    gpd = pytest.importorskip("geopandas")
+    from shapely.geometry import box
+
+    monkeypatch.chdir(tmp_path)
+    states = ["Edo", "Federal Capital Territory", "Ondo"]
+    gpd.GeoDataFrame(
+        {"NAME_1": states}, geometry=[box(i, 0, i + 1, 1) for i in range(3)], crs="EPSG:4326"
+    ).to_file(tmp_path / "states.shp")
+    (tmp_path / "weekly.csv").write_text("state,year,week,cases\nEdo,2020,1,3\n")
+
+    assert main(["panel", "--in", "weekly.csv", "--shapefile", "states.shp", "--out", "panel.csv"]) == 0
+    panel = pd.read_csv(tmp_path / "panel.csv")
+    assert sorted(panel["state"].unique()) == states
+
+
+def test_help_lists_every_subcommand(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--help"])
+
+    assert exc.value.code == 0
+    help_text = capsys.readouterr().out
+    for cmd in ["download", "aggregate", "ingest", "panel", "simulate", "calibrate", "scenarios", "figures", "app"]:
+        assert cmd in help_text
+
+
+def test_simulate_writes_trajectory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert main(["simulate", "--scenario", "intervention", "--days", "30"]) == 0
+    assert (tmp_path / "outputs" / "tables" / "seir_intervention.csv").exists()
@@ -0,0 +1,21 @@
+import pytest
+
+from lassa_model.forcing import ForcingParams, make_beta_function
+
+
+FORCING = ForcingParams(beta0=0.35, season_amp=0.2, season_phase=30.0, climate_coeff=0.25)
+
+
+def test_intervention_scales_beta_after_start():
+    base = make_beta_function(FORCING)
+    treated = make_beta_function(FORCING, intervention_start=180.0, intervention_effect=0.3)
+
+    assert treated(100.0) == pytest.approx(base(100.0))
+    assert treated(200.0) == pytest.approx(0.7 * base(200.0))
+
+
+def test_wetter_climate_raises_beta():
+    base = make_beta_function(FORCING)
+    wetter = make_beta_function(FORCING, climate_shock=0.5)
+
+    assert wetter(50.0) > base(50.0)
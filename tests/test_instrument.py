@@ -0,0 +1,85 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from lassa_model.instrument import RunRecorder, _reset_peak_rss, resource
+
+
+def test_run_record_written_with_stage_metrics(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text("a,b\n1,2\n")
+
+    with RunRecorder("demo", runs_dir=tmp_path / "runs", run_id="r1") as run:
+        with run.stage("load") as st:
+            st.read(src)
+            st.rows, st.cells = 1, 2
+
+    record = json.loads(next((tmp_path / "runs" / "r1").glob("demo_*.json")).read_text())
+    stage = record["stages"][0]
+
+    assert record["status"] == "ok"
+    assert stage["stage"] == "load"
+    assert stage["bytes_read"] == src.stat().st_size
+    assert stage["wall_s"] >= 0 and stage["cpu_s"] >= 0
+    assert (stage["rows"], stage["cells"]) == (1, 2)
+
+
+def test_failed_stage_is_recorded(tmp_path):
+    with pytest.raises(ValueError):
+        with RunRecorder("demo", runs_dir=tmp_path, run_id="r1") as run:
+            with run.stage("boom"):
+                raise ValueError("bad input")
+
+    record = json.loads(next((tmp_path / "r1").glob("demo_*.json")).read_text())
+
+    assert record["status"] == "failed"
+    assert record["stages"][0]["error"] == "ValueError: bad input"
+
+
+def test_cprofile_hook_dumps_stats(tmp_path):
+    with RunRecorder("demo", runs_dir=tmp_path, run_id="r1", profile="cprofile") as run:
+        with run.stage("work") as st:
+            sum(range(1000))
+
+    assert st.profile_path.endswith("_work.prof")
+    assert Path(st.profile_path).exists()
+
+
+@pytest.mark.skipif(not _reset_peak_rss(), reason="per-stage peak RSS needs Linux /proc/self/clear_refs")
+def test_peak_rss_is_per_stage(tmp_path):
+    with RunRecorder("demo", runs_dir=tmp_path, run_id="r1") as run:
+        with run.stage("big") as big:
+            block = bytearray(200 * 1024**2)
+            block[::4096] = b"x" * len(block[::4096])  # touch every page
+            del block
+        with run.stage("small") as small:
+            pass
+
+    assert big.peak_rss_mb - small.peak_rss_mb > 150
+    assert small.process_peak_rss_mb >= big.peak_rss_mb
+
+
+def test_recorders_in_one_process_write_separate_records(tmp_path):
+    for stage in ("daily", "states"):
+        with RunRecorder("aggregate", runs_dir=tmp_path, run_id="r1") as run:
+            with run.stage(stage):
+                pass
+
+    records = [json.loads(p.read_text()) for p in (tmp_path / "r1").glob("aggregate_*.json")]
+
+    assert sorted(r["stages"][0]["stage"] for r in records) == ["daily", "states"]
+
+
+@pytest.mark.skipif(resource is None, reason="child process usage needs the resource module")
+def test_stage_cpu_includes_child_processes(tmp_path):
+    burn = "import time\nt = time.process_time()\nwhile time.process_time() - t < 0.5: pass"
+
+    with RunRecorder("demo", runs_dir=tmp_path, run_id="r1") as run:
+        with run.stage("pool") as st:
+            subprocess.run([sys.executable, "-c", burn], check=True)
+
+    assert st.cpu_s >= 0.4
+    assert st.children_peak_rss_mb > 0
@@ -0,0 +1,32 @@
+import numpy as np
+
+from lassa_model.forcing import ForcingParams, make_beta_function
+from lassa_model.model import SEIRParams, seir_weekly
+from lassa_model.simulate import simulate_seir
+
+
+def test_seir_weekly_conserves_population():
+    N = 1.0e6
+    S, E, I, R = seir_weekly(104, np.ones(104), N=N)
+
+    assert np.allclose(S + E + I + R, N)
+    assert (np.stack([S, E, I, R]) >= 0).all()
+
+
+def test_seir_weekly_zero_forcing_has_no_new_exposures():
+    S, E, I, R = seir_weekly(52, np.zeros(52))
+
+    assert np.all(S == S[0])
+
+
+def test_simulate_seir_returns_requested_grid():
+    t_days = np.arange(0, 366, 1)
+    N = 1_000_000.0
+    y0 = (N - 30.0, 20.0, 10.0, 0.0)
+    beta_t = make_beta_function(ForcingParams(beta0=0.35, season_amp=0.2, season_phase=30.0, climate_coeff=0.25))
+
+    res = simulate_seir(t_days, y0, N, SEIRParams(sigma=0.1, gamma=1.0 / 14.0), beta_t)
+
+    assert np.array_equal(res["t"], t_days)
+    total = res["S"] + res["E"] + res["I"] + res["R"]
+    assert np.allclose(total, N, rtol=1e-6)
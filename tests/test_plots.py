@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lassa_model.plots import report_tasks, state_reports
+
+
+@pytest.fixture
+def panel(tmp_path):
+    rng = np.random.default_rng(0)
+    weeks = [(y, w) for y in (2019, 2020) for w in range(1, 53)]
+    df = pd.DataFrame(
+        [(s, y, w) for s in ("Edo", "Ondo", "Federal Capital Territory") for y, w in weeks],
+        columns=["state", "year", "week"],
+    )
+    df["cases"] = rng.poisson(2.0, len(df))
+    df["rain_mm"] = rng.gamma(2.0, 10.0, len(df))
+    df["temp_c"] = rng.normal(27.0, 1.5, len(df))
+    path = tmp_path / "panel.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_state_reports_draws_one_png_per_state(panel, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out_dir = tmp_path / "figs"
+
+    paths = state_reports(panel=str(panel), out_dir=str(out_dir), workers=1)
+
+    assert sorted(p.rsplit("/", 1)[-1] for p in paths) == ["Edo.png", "Federal_Capital_Territory.png", "Ondo.png"]
+
+
+def test_state_reports_skips_unchanged_states(panel, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out_dir = str(tmp_path / "figs")
+    state_reports(panel=str(panel), out_dir=out_dir, workers=1)
+
+    assert state_reports(panel=str(panel), out_dir=out_dir, workers=1) == []
+
+    df = pd.read_csv(panel, float_precision="round_trip")
+    df.loc[(df["state"] == "Ondo") & (df["week"] == 10), "cases"] += 5
+    df.to_csv(panel, index=False)
+
+    paths = state_reports(panel=str(panel), out_dir=out_dir, workers=1)
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["Ondo.png"]
+
+
+def test_lga_reports_keep_duplicate_names_apart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(1)
+    lgas = [("Benue", "Obi"), ("Nasarawa", "Obi"), ("Lagos", "Ikeja")]
+    df = pd.DataFrame(
+        [(s, l, 2020, w) for s, l in lgas for w in range(1, 53)],
+        columns=["state", "lga", "year", "week"],
+    )
+    df["cases"] = rng.poisson(2.0, len(df))
+    df["rain_mm"] = rng.gamma(2.0, 10.0, len(df))
+    df["temp_c"] = rng.normal(27.0, 1.5, len(df))
+    panel = tmp_path / "lga_panel.csv"
+    df.to_csv(panel, index=False)
+
+    paths = state_reports(panel=str(panel), out_dir=str(tmp_path / "figs"), by=["state", "lga"], workers=1)
+
+    assert sorted(p.rsplit("/", 1)[-1] for p in paths) == ["Benue_Obi.png", "Lagos_Ikeja.png", "Nasarawa_Obi.png"]
+
+
+def test_week_53_is_placed_before_next_year(tmp_path):
+    df = pd.DataFrame({
+        "state": "Edo",
+        "year": [2020, 2020, 2021, 2021],
+        "week": [52, 53, 1, 2],
+        "cases": [1, 2, 3, 4],
+        "rain_mm": 10.0,
+        "temp_c": 27.0,
+    })
+
+    (task,), _ = report_tasks(df, str(tmp_path), window=2)
+
+    assert np.all(np.diff(task["x"]) > 0)
+    assert task["x"][1] < 2021.0 <= task["x"][2]
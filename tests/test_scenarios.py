@@ -0,0 +1,13 @@
+from lassa_model.scenarios import main
+
+
+def test_unchanged_figure_is_not_reported_as_saved(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    main(days=30)
+    assert "Saved: outputs/figures/infectious_curves.png" in capsys.readouterr().out
+    assert list((tmp_path / "outputs" / "tables").glob("summary_*.csv"))
+
+    main(days=30)
+    out = capsys.readouterr().out
+    assert "Unchanged: outputs/figures/infectious_curves.png" in out
+    assert "Saved: outputs/figures/infectious_curves.png" not in out